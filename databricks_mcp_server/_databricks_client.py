@@ -6,12 +6,50 @@ authentication and handles making REST API calls to Databricks endpoints.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import asyncio
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Hashable, Optional, Tuple
 
-import requests
+import httpx
 
+from . import _json
 from .config import BaseConfig
 
+logger = logging.getLogger(__name__)
+
+# Status codes that are worth retrying (throttling and transient server errors).
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.2
+_BACKOFF_JITTER = 0.2
+# upper bound on a server supplied Retry-After delay
+_MAX_RETRY_AFTER = 30.0
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+	"""Return how long to wait before retrying `resp`.
+
+	Honours a Retry-After header (seconds or HTTP date, as sent with 429
+	responses), capped at _MAX_RETRY_AFTER; otherwise uses exponential
+	backoff. Random jitter is added so concurrent callers do not retry in
+	lockstep.
+	"""
+	delay = _BACKOFF_FACTOR * (2 ** attempt)
+	retry_after = resp.headers.get("Retry-After")
+	if retry_after:
+		try:
+			delay = float(retry_after)
+		except ValueError:
+			try:
+				delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+			except (TypeError, ValueError):
+				pass
+		delay = min(max(delay, 0.0), _MAX_RETRY_AFTER)
+	return delay + random.uniform(0, _BACKOFF_JITTER)
+
 
 class DatabricksClient:
 	"""Base client for making authenticated requests to Databricks REST API.
@@ -19,24 +57,69 @@ class DatabricksClient:
 	This client handles authorization and provides methods for making
 	HTTP requests to Databricks API endpoints.
 
+	A single httpx.AsyncClient is kept for the lifetime of the client so
+	connections to the workspace are pooled and reused (HTTPS keep-alive),
+	and concurrent calls are multiplexed on the event loop instead of
+	blocking worker threads. HTTP/2 is negotiated when the server supports
+	it, letting many concurrent requests share one TLS connection.
+
 	Attributes:
 		config: BaseConfig - The authentication configuration object.
 	"""
 
-	def __init__(self, config: BaseConfig) -> None:
+	def __init__(
+		self,
+		config: BaseConfig,
+		max_connections: int = 100,
+		max_keepalive_connections: int = 20,
+		timeout: float = 30,
+	) -> None:
 		"""Initialize the Databricks client with a config.
 
 		Args:
 			config: A BaseConfig instance with authentication details.
+			max_connections: Upper bound on concurrent connections to the workspace
+				(default: 100). Requests beyond this wait for a free connection.
+			max_keepalive_connections: Idle connections kept open for reuse
+				(default: 20).
+			timeout: Default request timeout in seconds (default: 30)
 		"""
 		self.config = config
 
+		limits = httpx.Limits(
+			max_connections=max_connections,
+			max_keepalive_connections=max_keepalive_connections,
+		)
+		# transport-level retries cover connection errors only; status based
+		# retries are handled in request()
+		transport = httpx.AsyncHTTPTransport(http2=True, retries=_MAX_RETRIES, limits=limits)
+		self._client = httpx.AsyncClient(transport=transport, timeout=timeout)
+
+		# in-flight GET requests keyed by (endpoint, params, raise_for_status);
+		# concurrent identical calls await the same task instead of each
+		# issuing their own request
+		self._inflight: Dict[Tuple[Hashable, ...], asyncio.Future] = {}
+
+		# serializes OAuth token refreshes issued from the event loop
+		self._token_lock = asyncio.Lock()
+
+	async def aclose(self) -> None:
+		"""Close the underlying HTTP client and release pooled connections."""
+		await self._client.aclose()
+
+	async def __aenter__(self) -> "DatabricksClient":
+		return self
+
+	async def __aexit__(self, *exc_info: Any) -> None:
+		await self.aclose()
+
 	@classmethod
 	def authorize(cls) -> "DatabricksClient":
 		"""Create and return a DatabricksClient with authorized config.
 
 		Reads environment variables and creates a BaseConfig, then initializes
-		the client with it.
+		the client with it. No network request is made until the first API
+		call; use `clients.rest_client()` to share a single instance.
 
 		Returns:
 			A DatabricksClient instance ready to make API calls.
@@ -47,7 +130,22 @@ class DatabricksClient:
 		cfg = BaseConfig.authorize()
 		return cls(cfg)
 
-	def request(
+	async def _auth_headers(self) -> Dict[str, str]:
+		"""Return the config's auth headers without blocking the event loop.
+
+		Obtaining an OAuth token is a blocking HTTP call (with retries), so
+		when one is needed the headers are built on a worker thread. The lock
+		makes concurrent requests wait for that single refresh.
+		"""
+		if not self.config.token_expired:
+			return self.config.headers
+
+		async with self._token_lock:
+			if self.config.token_expired:
+				return await asyncio.to_thread(lambda: self.config.headers)
+		return self.config.headers
+
+	async def request(
 		self,
 		method: str,
 		endpoint: str,
@@ -55,9 +153,13 @@ class DatabricksClient:
 		params: Optional[Dict[str, Any]] = None,
 		headers: Optional[Dict[str, str]] = None,
 		timeout: int = 30,
-	) -> requests.Response:
+	) -> httpx.Response:
 		"""Make an authenticated HTTP request to a Databricks API endpoint.
 
+		Throttled (429) and transient server errors (5xx) are retried up to
+		three times with jittered exponential backoff, waiting for the
+		server's Retry-After delay when one is given.
+
 		Args:
 			method: HTTP method (GET, POST, PUT, DELETE, PATCH, etc.)
 			endpoint: API endpoint path (e.g., "/api/2.1/jobs/list")
@@ -67,36 +169,42 @@ class DatabricksClient:
 			timeout: Request timeout in seconds (default: 30)
 
 		Returns:
-			The requests.Response object from the API call.
+			The httpx.Response object from the API call.
 
 		Raises:
 			ValueError: if host is not configured in the config.
-			requests.RequestException: if the request fails.
+			httpx.HTTPError: if the request fails.
 		"""
 		if not self.config.host:
 			raise ValueError("DATABRICKS_HOST is not configured")
 
 		url = f"{self.config.host}{endpoint}"
 
-		# Get base headers from config (includes Authorization)
-		req_headers = self.config.headers.copy()
-
-		# Merge with any additional headers provided
+		# Get base headers from config (includes Authorization); the config
+		# returns a shared dict, so only copy it when merging extra headers
+		req_headers = await self._auth_headers()
 		if headers:
-			req_headers.update(headers)
-
-		resp = requests.request(
-			method=method,
-			url=url,
-			json=json_data,
-			params=params,
-			headers=req_headers,
-			timeout=timeout,
-		)
-
-		return resp
-
-	def do(
+			req_headers = {**req_headers, **headers}
+
+		attempt = 0
+		while True:
+			resp = await self._client.request(
+				method=method,
+				url=url,
+				json=json_data,
+				params=params,
+				headers=req_headers,
+				timeout=timeout,
+			)
+			logger.debug(f"{method} {endpoint} -> {resp.status_code} ({resp.http_version})")
+			if resp.status_code not in _RETRY_STATUSES or attempt >= _MAX_RETRIES:
+				return resp
+
+			await resp.aclose()
+			await asyncio.sleep(_retry_delay(resp, attempt))
+			attempt += 1
+
+	async def do(
 		self,
 		method: str,
 		endpoint: str,
@@ -109,7 +217,8 @@ class DatabricksClient:
 		"""Make an authenticated HTTP request and return the JSON response.
 
 		Convenience method that wraps request() and automatically parses
-		the JSON response.
+		the JSON response. Concurrent identical GET requests are coalesced
+		into a single HTTP call whose result is shared by all callers.
 
 		Args:
 			method: HTTP method (GET, POST, PUT, DELETE, PATCH, etc.)
@@ -126,10 +235,51 @@ class DatabricksClient:
 
 		Raises:
 			ValueError: if host is not configured.
-			requests.RequestException: if the request fails and raise_for_status=True.
+			httpx.HTTPStatusError: if the request fails and raise_for_status=True.
 			ValueError: if the response cannot be parsed as JSON.
 		"""
-		resp = self.request(
+		if method.upper() != "GET" or json_data is not None or headers:
+			return await self._do(
+				method, endpoint, json_data, params, headers, timeout, raise_for_status
+			)
+
+		# list values (repeated query params) are keyed as tuples; anything else
+		# that cannot be hashed is simply not coalesced
+		params_key = tuple(sorted(
+			(k, tuple(v) if isinstance(v, (list, tuple)) else v)
+			for k, v in (params or {}).items()
+		))
+		key = (endpoint, params_key, raise_for_status)
+		try:
+			hash(key)
+		except TypeError:
+			return await self._do(
+				method, endpoint, json_data, params, headers, timeout, raise_for_status
+			)
+
+		task = self._inflight.get(key)
+		if task is None:
+			task = asyncio.ensure_future(
+				self._do(method, endpoint, json_data, params, headers, timeout, raise_for_status)
+			)
+			self._inflight[key] = task
+			task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+		# shield so one caller being cancelled does not cancel the shared request
+		return await asyncio.shield(task)
+
+	async def _do(
+		self,
+		method: str,
+		endpoint: str,
+		json_data: Optional[Dict[str, Any]],
+		params: Optional[Dict[str, Any]],
+		headers: Optional[Dict[str, str]],
+		timeout: int,
+		raise_for_status: bool,
+	) -> Dict[str, Any]:
+		"""Perform a single request and parse its JSON body (see do())."""
+		resp = await self.request(
 			method=method,
 			endpoint=endpoint,
 			json_data=json_data,
@@ -138,11 +288,17 @@ class DatabricksClient:
 			timeout=timeout,
 		)
 
-		if raise_for_status:
-			resp.raise_for_status()
+		if raise_for_status and resp.is_error:
+			# include the API's error body (error_code / message) so callers see
+			# why the request failed, not just the status code
+			detail = resp.content[:512].decode("utf-8", errors="replace")
+			raise httpx.HTTPStatusError(
+				f"{resp.status_code} {resp.reason_phrase} for {endpoint}: {detail}",
+				request=resp.request,
+				response=resp,
+			)
 
 		try:
-			return resp.json()
-		except ValueError as e:
+			return _json.loads(resp.content)
+		except _json.JSONDecodeError as e:
 			raise ValueError(f"Failed to parse JSON response: {e}")
-
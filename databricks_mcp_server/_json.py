@@ -0,0 +1,36 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson parses and serializes large Unity Catalog / lineage payloads
+noticeably faster than the stdlib module; it is optional and the stdlib
+`json` module is used as a fallback.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Union
+
+try:
+	import orjson
+except ImportError:  # pragma: no cover - optional dependency
+	orjson = None
+
+import json
+
+JSONDecodeError = orjson.JSONDecodeError if orjson else json.JSONDecodeError
+
+
+def loads(data: Union[bytes, str]) -> Any:
+	"""Parse a JSON document from bytes or str."""
+	if orjson:
+		return orjson.loads(data)
+	return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+	"""Serialize `obj` to a JSON string indented by two spaces.
+
+	Values that are not natively JSON serializable are rendered with str().
+	"""
+	if orjson:
+		return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+	return json.dumps(obj, default=str, indent=2)
@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial, wraps
+from typing import Any, AsyncIterator, Callable, TypeVar
+import atexit
+import logging
+import threading
+
+import asyncio
+
+from databricks.sdk import WorkspaceClient
+
+from ._databricks_client import DatabricksClient
+from .config import DatabricksSDKConfig, MAX_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# dedicated pool for blocking SDK calls, sized for network I/O rather than
+# sharing asyncio's default executor
+_io_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="dbx-io")
+atexit.register(_io_executor.shutdown, wait=False)
+
+# backpressure for tool fan-out so large requests stay under workspace rate limits
+_fanout_limit = asyncio.Semaphore(MAX_CONCURRENCY)
+
+
+def _singleton(factory: Callable[[], T]) -> Callable[[], T]:
+    """
+    Caches the result of a zero-argument factory, building it at most once even when
+    the warmup thread and the first tool call race for it.
+    """
+    lock = threading.Lock()
+    instance: list = []
+
+    @wraps(factory)
+    def get() -> T:
+        if not instance:
+            with lock:
+                if not instance:
+                    instance.append(factory())
+        return instance[0]
+
+    return get
+
+
+@_singleton
+def rest_client() -> DatabricksClient:
+    """
+    Returns the shared REST client, authorizing it on first use.
+    """
+    logger.info("initializing databricks rest client")
+    return DatabricksClient.authorize()
+
+
+@_singleton
+def sdk_client() -> WorkspaceClient:
+    """
+    Returns the shared Databricks SDK workspace client, authorizing it on first use.
+    """
+    logger.info("initializing databricks sdk client")
+    return WorkspaceClient(config=DatabricksSDKConfig.authorize())
+
+
+def warmup() -> None:
+    """
+    Authorizes both clients and opens the SDK connection pool ahead of the first tool call.
+
+    Meant to run in a background thread at server start; failures are only logged.
+    The async REST client's connections belong to the serving event loop, so only
+    its OAuth token (shared process-wide) is obtained here.
+    """
+    try:
+        rest_client().config.headers
+        sdk_client().current_user.me()
+        logger.info("databricks clients warmed up")
+    except Exception as e:
+        logger.warning(f"databricks client warmup failed: {e}")
+
+
+@asynccontextmanager
+async def fanout_slot() -> AsyncIterator[None]:
+    """
+    Holds one of the `DATABRICKS_MCP_MAX_CONCURRENCY` slots for an outbound workspace request.
+    """
+    if _fanout_limit.locked():
+        logger.info(f"workspace concurrency limit ({MAX_CONCURRENCY}) reached, waiting for a free slot")
+    async with _fanout_limit:
+        yield
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Runs a blocking (e.g. Databricks SDK) call on the dedicated I/O thread pool.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor, partial(fn, *args, **kwargs))
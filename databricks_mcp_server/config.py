@@ -10,7 +10,8 @@ Behavior for BaseConfig:
 - If `DATABRICKS_TOKEN` is present, it uses it as a PAT (personal access token).
 - Otherwise, if `DATABRICKS_CLIENT_ID` and `DATABRICKS_CLIENT_SECRET` are
   present, and `DATABRICKS_OAUTH_TOKEN_URL` is provided, it performs an
-  OAuth2 client-credentials request to obtain an access token.
+  OAuth2 client-credentials request to obtain an access token the first time
+  headers are needed (never at construction time).
 
 If neither method has sufficient environment variables, `BaseConfig.authorize`
 will raise `ValueError`.
@@ -18,13 +19,69 @@ will raise `ValueError`.
 
 from __future__ import annotations
 
+from concurrent.futures import Future
+import importlib.util
 import os
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from databricks.sdk.core import Config as DatabricksConfig
 
+from . import _json
+
+# Lifetime (seconds) of cached Unity Catalog metadata and lineage responses.
+# Set to 0 to disable caching.
+CACHE_TTL_SECONDS = float(os.environ.get("DATABRICKS_MCP_CACHE_TTL", "300"))
+
+# Maximum number of concurrent workspace requests issued when a tool fans out
+# over many tables.
+MAX_CONCURRENCY = int(os.environ.get("DATABRICKS_MCP_MAX_CONCURRENCY", "20"))
+
+# Maximum number of upstream (and downstream) tables listed per table; the
+# rest are summarised as a count to keep lineage output small.
+MAX_LINEAGE_NODES = int(os.environ.get("DATABRICKS_MCP_MAX_LINEAGE_NODES", "50"))
+
+# Shared session for token endpoint calls so refreshes reuse the TLS
+# connection to the identity provider. Transient IdP failures are retried with
+# jittered exponential backoff, honouring Retry-After when present.
+_oauth_session = requests.Session()
+_oauth_adapter = HTTPAdapter(
+	max_retries=Retry(
+		total=3,
+		backoff_factor=0.3,
+		backoff_jitter=0.2,
+		status_forcelist=(429, 500, 502, 503, 504),
+		allowed_methods=frozenset(["POST"]),
+		respect_retry_after_header=True,
+		raise_on_status=False,
+	)
+)
+_oauth_session.mount("http://", _oauth_adapter)
+_oauth_session.mount("https://", _oauth_adapter)
+
+# Compressed responses cut transfer size for large list/lineage payloads. Only
+# advertise brotli when a decoder is installed, otherwise httpx cannot decode it.
+_ACCEPT_ENCODING = (
+	"gzip, br"
+	if any(importlib.util.find_spec(mod) for mod in ("brotli", "brotlicffi"))
+	else "gzip"
+)
+
+# (connect, read) timeouts for token requests
+_OAUTH_TIMEOUT = (3.05, 10)
+
+# Process-wide OAuth token store shared by every BaseConfig instance, keyed by
+# (client_id, token_url, scope) -> (access_token, expires_at).
+_TOKEN_CACHE: Dict[Tuple[str, str, Optional[str]], Tuple[str, float]] = {}
+# Token requests in progress, keyed like _TOKEN_CACHE; resolves to the same
+# (access_token, expires_at) pair.
+_TOKEN_INFLIGHT: Dict[Tuple[str, str, Optional[str]], Future] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
 
 class BaseConfig:
 	"""Holds Databricks configuration and provides authorization headers.
@@ -62,6 +119,8 @@ class BaseConfig:
 		# runtime-only fields
 		self.access_token: Optional[str] = None
 		self.token_expires_at: Optional[float] = None
+		self._cached_headers: Optional[Dict[str, str]] = None
+		self._cached_token_sig: Optional[Tuple[Optional[str], Optional[str], Optional[float]]] = None
 
 	def __repr__(self) -> str:  # pragma: no cover - trivial
 		return (
@@ -77,12 +136,14 @@ class BaseConfig:
 		Order:
 		  1. If `DATABRICKS_TOKEN` is present, create config with PAT.
 		  2. Else if `DATABRICKS_CLIENT_ID` and `DATABRICKS_CLIENT_SECRET`
-			 (and `DATABRICKS_OAUTH_TOKEN_URL`) are present, perform OAuth2
-			 client-credentials request and populate `access_token`.
+			 (and `DATABRICKS_OAUTH_TOKEN_URL`) are present, create config for
+			 the OAuth2 client-credentials flow.
+
+		No network request is made here; the OAuth access token is requested
+		lazily on the first `headers` access, so this is cheap to call.
 
 		Raises:
-			ValueError: if no valid authentication env vars are available or
-						if an OAuth token request fails.
+			ValueError: if no valid authentication env vars are available.
 		"""
 		env = os.environ
 		host = env.get("DATABRICKS_HOST")
@@ -114,41 +175,6 @@ class BaseConfig:
 				oauth_token_url=token_url,
 				oauth_scope=scope,
 			)
-
-			# perform token request
-			data = {"grant_type": "client_credentials"}
-			if scope:
-				data["scope"] = scope
-
-			# Try standard client credentials form first
-			data["client_id"] = client_id
-			data["client_secret"] = client_secret
-
-			headers = {"Content-Type": "application/x-www-form-urlencoded"}
-
-			resp = requests.post(token_url, data=data, headers=headers, timeout=10)
-			try:
-				resp.raise_for_status()
-			except Exception as exc:  # pragma: no cover - network error
-				raise ValueError(
-					f"failed to obtain OAuth token from {token_url}: {exc} - {resp.text}"
-				)
-
-			body = resp.json()
-			access_token = body.get("access_token")
-			if not access_token:
-				raise ValueError(f"token endpoint did not return access_token: {body}")
-
-			cfg.access_token = access_token
-			expires_in = body.get("expires_in")
-			if expires_in:
-				try:
-					self_expires = float(expires_in)
-				except Exception:
-					self_expires = None
-				if self_expires:
-					cfg.token_expires_at = time.time() + float(self_expires) - 10
-
 			return cfg
 
 		# If we reach here, no supported auth variables were present
@@ -168,7 +194,52 @@ class BaseConfig:
 		if self.access_token and self.token_expires_at and time.time() < self.token_expires_at:
 			return
 
-		# request a new token
+		key = (self.client_id, self.oauth_token_url, self.oauth_scope)
+		# The lock only guards the cache and the in-flight map; the token
+		# request itself runs outside it. Concurrent callers wait on the first
+		# caller's future instead of each issuing their own request.
+		with _TOKEN_CACHE_LOCK:
+			now = time.time()
+			# lazily evict expired entries
+			for stale in [k for k, (_, exp) in _TOKEN_CACHE.items() if exp <= now]:
+				del _TOKEN_CACHE[stale]
+
+			cached = _TOKEN_CACHE.get(key)
+			if cached:
+				self.access_token, self.token_expires_at = cached
+				return
+
+			pending = _TOKEN_INFLIGHT.get(key)
+			if pending is None:
+				future: Future = Future()
+				_TOKEN_INFLIGHT[key] = future
+
+		if pending is not None:
+			self.access_token, self.token_expires_at = pending.result()
+			return
+
+		try:
+			token = self._request_token()
+		except BaseException as exc:
+			with _TOKEN_CACHE_LOCK:
+				del _TOKEN_INFLIGHT[key]
+			future.set_exception(exc)
+			raise
+
+		with _TOKEN_CACHE_LOCK:
+			if token[1]:
+				_TOKEN_CACHE[key] = token
+			del _TOKEN_INFLIGHT[key]
+		future.set_result(token)
+		self.access_token, self.token_expires_at = token
+
+	def _request_token(self) -> Tuple[str, Optional[float]]:
+		"""Request a new access token from the token endpoint.
+
+		Returns:
+			The access token and the Unix ts it should be refreshed at (None if
+			the endpoint did not report an expiry).
+		"""
 		data = {"grant_type": "client_credentials"}
 		if self.oauth_scope:
 			data["scope"] = self.oauth_scope
@@ -176,13 +247,22 @@ class BaseConfig:
 		data["client_secret"] = self.client_secret
 
 		headers = {"Content-Type": "application/x-www-form-urlencoded"}
-		resp = requests.post(self.oauth_token_url, data=data, headers=headers, timeout=10)
-		resp.raise_for_status()
-		body = resp.json()
+		resp = _oauth_session.post(self.oauth_token_url, data=data, headers=headers, timeout=_OAUTH_TIMEOUT)
+		try:
+			resp.raise_for_status()
+		except requests.HTTPError as exc:  # pragma: no cover - network error
+			# only echo the start of the error body; it is already buffered
+			detail = resp.content[:512].decode("utf-8", errors="replace")
+			raise ValueError(
+				f"failed to obtain OAuth token from {self.oauth_token_url}: {exc} - {detail}"
+			)
+
+		body = _json.loads(resp.content)
 		access_token = body.get("access_token")
 		if not access_token:
 			raise ValueError(f"token endpoint did not return access_token: {body}")
-		self.access_token = access_token
+
+		expires_at = None
 		expires_in = body.get("expires_in")
 		if expires_in:
 			try:
@@ -190,23 +270,48 @@ class BaseConfig:
 			except Exception:
 				expires_val = None
 			if expires_val:
-				self.token_expires_at = time.time() + expires_val - 10
+				expires_at = time.time() + expires_val - 10
+		return access_token, expires_at
+
+	@property
+	def token_expired(self) -> bool:
+		"""Whether building `headers` requires requesting a new OAuth token.
+
+		The token request is blocking network I/O, so async callers use this to
+		decide whether `headers` must be read off the event loop.
+		"""
+		if self.pat_token:
+			return False
+		return not (self.access_token and self.token_expires_at and time.time() < self.token_expires_at)
 
 	@property
 	def headers(self) -> Dict[str, str]:
 		"""Return headers ready to use for Databricks REST API calls.
 
 		Uses the PAT when available, otherwise uses an OAuth access token.
+		The dict is built once and reused until the token changes, so callers
+		must copy it before adding their own headers.
 		"""
-		if self.pat_token:
-			return {"Authorization": f"Bearer {self.pat_token}", "Content-Type": "application/json"}
+		if not self.pat_token:
+			# ensure we have an oauth token
+			self._ensure_oauth_token()
+
+		token_sig = (self.pat_token, self.access_token, self.token_expires_at)
+		if self._cached_headers is not None and token_sig == self._cached_token_sig:
+			return self._cached_headers
 
-		# ensure we have an oauth token
-		self._ensure_oauth_token()
-		if self.access_token:
-			return {"Authorization": f"Bearer {self.access_token}", "Content-Type": "application/json"}
+		token = self.pat_token or self.access_token
+		if not token:
+			raise ValueError("No authentication token available to build headers")
 
-		raise ValueError("No authentication token available to build headers")
+		self._cached_headers = {
+			"Authorization": f"Bearer {token}",
+			"Content-Type": "application/json",
+			"Accept": "application/json",
+			"Accept-Encoding": _ACCEPT_ENCODING,
+		}
+		self._cached_token_sig = token_sig
+		return self._cached_headers
 
 
 class DatabricksSDKConfig:
@@ -220,12 +325,19 @@ class DatabricksSDKConfig:
 	def authorize(
 		http_timeout_seconds: int = 30,
 		retry_timeout_seconds: int = 60,
+		max_connection_pools: int = 32,
+		max_connections_per_pool: int = 32,
 	) -> Any:
 		"""Create and return a Databricks SDK Config based on environment variables.
 
 		Args:
 			http_timeout_seconds: Timeout for HTTP requests (default: 30)
 			retry_timeout_seconds: Timeout for retries (default: 60)
+			max_connection_pools: Connection pools kept by the SDK's HTTP
+				session (default: 32)
+			max_connections_per_pool: Keep-alive connections per pool; sized to
+				match the I/O thread pool so concurrent SDK calls reuse sockets
+				(default: 32)
 
 		Returns:
 			A databricks.sdk.core.Config object ready for use with SDK clients.
@@ -248,6 +360,8 @@ class DatabricksSDKConfig:
 				token=token,
 				http_timeout_seconds=http_timeout_seconds,
 				retry_timeout_seconds=retry_timeout_seconds,
+				max_connection_pools=max_connection_pools,
+				max_connections_per_pool=max_connections_per_pool,
 			)
 
 		# Check for OAuth credentials
@@ -261,6 +375,8 @@ class DatabricksSDKConfig:
 				client_secret=client_secret,
 				http_timeout_seconds=http_timeout_seconds,
 				retry_timeout_seconds=retry_timeout_seconds,
+				max_connection_pools=max_connection_pools,
+				max_connections_per_pool=max_connections_per_pool,
 			)
 
 		raise ValueError(
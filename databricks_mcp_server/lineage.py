@@ -1,24 +1,157 @@
+from typing import Dict, List
 import logging
 
-from ._databricks_client import DatabricksClient
+import asyncio
+
+from cachetools import TTLCache
+from databricks.sdk.service.sql import ExecuteStatementRequestOnWaitTimeout, StatementParameterListItem
+
+from .clients import rest_client, fanout_slot
+from .config import CACHE_TTL_SECONDS
+from .warehouse import DATABRICKS_SQL_WAREHOUSE_ID, execute_query
 
 logger = logging.getLogger(__name__)
 
-client: DatabricksClient = DatabricksClient.authorize()
+# lineage responses keyed by table full name; failed requests are never cached
+_lineage_cache: TTLCache = TTLCache(maxsize=4096, ttl=CACHE_TTL_SECONDS)
+
+# how far back the system lineage table is searched
+LINEAGE_LOOKBACK_DAYS = 30
+
+# server-side wait for the system lineage query; the statement is cancelled
+# (and the REST API used instead) if a cold warehouse cannot answer in time
+LINEAGE_QUERY_TIMEOUT = "10s"
+
+# set once the system lineage query fails (e.g. no SELECT grant on
+# system.access.table_lineage) so later calls go straight to the REST API
+_system_lineage_failed = False
 
-def get_table_lineage(table_name: str) -> dict:
+async def get_table_lineage(table_name: str) -> dict:
     """
     Fetches the table upstream and downstream lineage information.
     """
+    try:
+        return _lineage_cache[table_name]
+    except KeyError:
+        pass
+
     logger.info(f"fetching lineage for: {table_name}")
 
     endpoint = "/api/2.0/lineage-tracking/table-lineage/"
-    params = {"table_name": table_name, "include_entity_lineage": True}
+    # only table nodes are rendered, so skip notebook/job/dashboard entities
+    params = {"table_name": table_name, "include_entity_lineage": False}
 
-    resp = client.do(
-        method="GET",
-        endpoint=endpoint,
-        params=params
-    )
+    async with fanout_slot():
+        resp = await rest_client().do(
+            method="GET",
+            endpoint=endpoint,
+            params=params
+        )
+    _lineage_cache[table_name] = resp
 
     return resp
+
+
+def evict_table_lineage(table_names: List[str]) -> None:
+    """
+    Drops cached lineage for the given tables so the next lookup hits the API.
+    """
+    for table_name in table_names:
+        _lineage_cache.pop(table_name, None)
+
+
+def _table_info(full_name: str) -> dict:
+    """
+    Builds a lineage-API style `tableInfo` entry from a three-level table name.
+    """
+    catalog, schema, name = (full_name.split(".", 2) + ["", ""])[:3]
+    return {"tableInfo": {"catalog_name": catalog, "schema_name": schema, "name": name}}
+
+
+async def get_lineage_for_tables(table_names: List[str]) -> Dict[str, dict]:
+    """
+    Fetches lineage for several tables with a single query against `system.access.table_lineage`.
+
+    Returns a mapping of table name to a lineage dict shaped like the lineage
+    REST API response (`upstreams` / `downstreams` with `tableInfo` entries).
+
+    Raises:
+        RuntimeError: if the lineage query does not succeed.
+    """
+    # Unity Catalog names are case-insensitive and stored lower-case in system tables
+    names = list(dict.fromkeys(table_name.lower() for table_name in table_names))
+    markers = ", ".join(f":t{idx}" for idx in range(len(names)))
+    parameters = [
+        StatementParameterListItem(name=f"t{idx}", value=name)
+        for idx, name in enumerate(names)
+    ]
+    query = f"""
+        SELECT DISTINCT source_table_full_name, target_table_full_name
+        FROM system.access.table_lineage
+        WHERE (source_table_full_name IN ({markers}) OR target_table_full_name IN ({markers}))
+          AND source_table_full_name IS NOT NULL
+          AND target_table_full_name IS NOT NULL
+          AND event_date >= date_sub(current_date(), {LINEAGE_LOOKBACK_DAYS})
+    """
+
+    logger.info(f"fetching lineage from system tables for: {table_names}")
+    resp = await execute_query(
+        query=query,
+        parameters=parameters,
+        wait_timeout=LINEAGE_QUERY_TIMEOUT,
+        on_wait_timeout=ExecuteStatementRequestOnWaitTimeout.CANCEL,
+    )
+    state = resp.get("state")
+    if state != "SUCCEEDED":
+        if state == "FAILED":
+            # a failing query (missing grant, system schema not enabled) keeps
+            # failing; a timeout (CANCELED) is retried on the next call
+            global _system_lineage_failed
+            _system_lineage_failed = True
+        raise RuntimeError(f"lineage query ended in state {state}: {resp.get('error')}")
+
+    found = {name: {"upstreams": [], "downstreams": []} for name in names}
+    for row in resp["data"]:
+        source = row["source_table_full_name"]
+        target = row["target_table_full_name"]
+        if target in found:
+            found[target]["upstreams"].append(_table_info(source))
+        if source in found:
+            found[source]["downstreams"].append(_table_info(target))
+
+    # every spelling of a name gets its lineage; tables without any rows get
+    # an empty dict, like the REST API response for a table without lineage
+    lineages = {}
+    for table_name in table_names:
+        lineage = found[table_name.lower()]
+        lineages[table_name] = lineage if lineage["upstreams"] or lineage["downstreams"] else {}
+
+    return lineages
+
+
+async def get_table_lineages(table_names: List[str]) -> List[dict]:
+    """
+    Fetches lineage for several tables at once, in the same order as `table_names`.
+
+    When a SQL warehouse is configured, all uncached tables are resolved with a
+    single `system.access.table_lineage` query. Otherwise (or if that query
+    times out or fails; a failure disables it for the rest of the process)
+    the per-table lineage REST requests are issued concurrently over the
+    shared pooled connection.
+    """
+    missing = [table_name for table_name in dict.fromkeys(table_names) if table_name not in _lineage_cache]
+
+    resolved: Dict[str, dict] = {}
+    if missing and DATABRICKS_SQL_WAREHOUSE_ID and not _system_lineage_failed:
+        try:
+            resolved = await get_lineage_for_tables(missing)
+            _lineage_cache.update(resolved)
+        except Exception as e:
+            logger.warning(f"falling back to lineage REST API: {e}")
+
+    async def _lineage(table_name: str) -> dict:
+        if table_name in resolved:
+            return resolved[table_name]
+        return await get_table_lineage(table_name)
+
+    return await asyncio.gather(*[_lineage(table_name) for table_name in table_names])
@@ -1,19 +1,27 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 
-import asyncio
+from mcp.server.fastmcp import Context
 
 from .warehouse import execute_query
 from .unitycatalog import (
     get_schemas_in_catalog,
     get_tables_in_schema,
     get_table_info,
+    get_table_lineage_info,
 )
 
 logger = logging.getLogger(__name__)
 
 
-async def fetch_schemas_in_catalog(catalog: str) -> str:
+def _format_error(summary: str, details: str) -> str:
+    """
+    Formats a tool error as Markdown for the agent.
+    """
+    return f"**Error**: {summary}\n**Details:**\n```\n{details}\n```\n"
+
+
+async def fetch_schemas_in_catalog(catalog: str, limit: int = 1000) -> str:
     """
     Retrieves all schemas within a given Unity Catalog catalog.
 
@@ -26,6 +34,7 @@ async def fetch_schemas_in_catalog(catalog: str) -> str:
 
     Args:
         catalog: The Unity Catalog catalog name (e.g., "main").
+        limit: Maximum number of schemas to return, at least 1 (default: 1000).
     
     Returns:
         A Markdown-formatted string containing the list of schemas in the specified catalog.
@@ -34,23 +43,17 @@ async def fetch_schemas_in_catalog(catalog: str) -> str:
     logger.info(f"fetching list of schemas in catalog: {catalog}")
 
     try:
-        result = await asyncio.to_thread(
-            get_schemas_in_catalog,
-            catalog_name=catalog,
-        )
+        if limit < 1:
+            raise ValueError(f"`limit` must be at least 1, got {limit}.")
+        result = await get_schemas_in_catalog(catalog_name=catalog, limit=limit)
         return result
     except Exception as e:
         error_details = str(e)
         logger.error(error_details)
-        return f"""**Error**: Could not retrieve list of schemas
-**Details:**
-```
-{error_details}
-```
-"""
+        return _format_error("Could not retrieve list of schemas", error_details)
 
 
-async def fetch_tables_in_schema(catalog: str, schema: str) -> str:
+async def fetch_tables_in_schema(catalog: str, schema: str, limit: int = 1000) -> str:
     """
     Retrieves all tables within a given Unity Catalog catalog and schema.
 
@@ -66,6 +69,7 @@ async def fetch_tables_in_schema(catalog: str, schema: str) -> str:
     Args:
         catalog: The Unity Catalog catalog name (e.g., "main").
         schema: The schema name within the catalog (e.g., "analytics").
+        limit: Maximum number of tables to return, at least 1 (default: 1000).
     
     Returns:
         A Markdown-formatted string containing the list of tables in the specified schema.
@@ -74,63 +78,100 @@ async def fetch_tables_in_schema(catalog: str, schema: str) -> str:
     logger.info(f"fetching list of tables in schema: {catalog}.{schema}")
 
     try:
-        result = await asyncio.to_thread(
-            get_tables_in_schema,
-            catalog_name=catalog,
-            schema_name=schema,
-        )
+        if limit < 1:
+            raise ValueError(f"`limit` must be at least 1, got {limit}.")
+        result = await get_tables_in_schema(catalog_name=catalog, schema_name=schema, limit=limit)
         return result
     except Exception as e:
         error_details = str(e)
         logger.error(error_details)
-        return f"""**Error**: Could not retrieve list of tables
-**Details:**
-```
-{error_details}
-```
-"""
-
-async def fetch_table_info(table_names: List) -> str:
+        return _format_error("Could not retrieve list of tables", error_details)
+
+async def fetch_table_info(
+    table_names: List,
+    include_lineage: bool = False,
+    refresh: bool = False,
+    ctx: Optional[Context] = None,
+) -> str:
     """
-    Provides a detailed description of a Unity Catalog table along with lineage information.
+    Provides a detailed description of a Unity Catalog table.
     
     Use this tool to understand the structure (columns, data types) for a single table or multiple tables at once.
     This is essential before constructing SQL queries against the table. 
-    It also includes comprehensive lineage information (if there is any) that goes beyond traditional table-to-table dependencies:
-
-    **Table Lineage:**
-    - Upstream tables (tables this table reads from)
-    - Downstream tables (tables that read from this table)
+    Lineage is not included by default; use `fetch_table_lineage` (or set `include_lineage`) when you
+    need to know which tables feed into or read from these tables.
 
-    The output is formatted in Markdown.
+    The output is formatted in Markdown. Progress notifications are sent as each table is described.
 
     Args:
         table_names: A list of fully qualified three-level name of the table (e.g., ['catalog.schema.table1', ...]).
+        include_lineage: Set to True to also include upstream and downstream tables for each table.
+        refresh: Set to True to bypass cached metadata and lineage, e.g. right after a table was altered.
     
     Returns:
         A Markdown-formatted string describing the requested tables. This typically includes:
         - Table identifiers (table full name, type)
         - Column definitions (name, data type, nullability, comments)
         - Table constraints information (if any)
-        - Upstream and downstream lineage information (if available)
+        - Upstream and downstream lineage information (only if `include_lineage` is set)
     """
     logger.info(f"fetching metadata for tables: {table_names}")
     try:
         assert isinstance(table_names, list), ValueError("`table_names` argument should be a list of table names.")
-        result = await asyncio.to_thread(
-            get_table_info,
+        on_progress = None
+        if ctx is not None:
+            async def on_progress(done: int, total: int) -> None:
+                # progress is best-effort; a failed notification must not fail the tool
+                try:
+                    await ctx.report_progress(done, total, message=f"described {done}/{total} tables")
+                except Exception as e:
+                    logger.debug(f"progress notification failed: {e}")
+
+        result = await get_table_info(
             table_names=table_names,
+            refresh=refresh,
+            include_lineage=include_lineage,
+            on_progress=on_progress,
         )
         return result
     except Exception as e:
         error_details = str(e)
         logger.error(error_details)
-        return f"""**Error**: Could not retrieve table information
-**Details:**
-```
-{error_details}
-```
-"""
+        return _format_error("Could not retrieve table information", error_details)
+
+
+async def fetch_table_lineage(table_names: List, refresh: bool = False) -> str:
+    """
+    Retrieves the upstream and downstream lineage of one or more Unity Catalog tables.
+
+    Use this tool when you need to:
+    - Find the source tables a table is built from (upstream)
+    - Find the tables that read from a table (downstream)
+    - Trace how data flows between tables before validating assumptions about it
+
+    **Table Lineage:**
+    - Upstream tables (tables this table reads from)
+    - Downstream tables (tables that read from this table)
+
+    The output is formatted in Markdown.
+
+    Args:
+        table_names: A list of fully qualified three-level name of the table (e.g., ['catalog.schema.table1', ...]).
+        refresh: Set to True to bypass cached lineage.
+    
+    Returns:
+        A Markdown-formatted string listing upstream and downstream tables for each requested table.
+        If an error occurs, a Markdown-formatted error message is returned instead
+    """
+    logger.info(f"fetching lineage for tables: {table_names}")
+    try:
+        assert isinstance(table_names, list), ValueError("`table_names` argument should be a list of table names.")
+        result = await get_table_lineage_info(table_names=table_names, refresh=refresh)
+        return result
+    except Exception as e:
+        error_details = str(e)
+        logger.error(error_details)
+        return _format_error("Could not retrieve table lineage", error_details)
 
 
 async def execute_spark_sql_query(query: str) -> Dict[str, Any]:
@@ -161,7 +202,7 @@ async def execute_spark_sql_query(query: str) -> Dict[str, Any]:
     """
     logger.info(f"executing spark sql statement: \n{query}")
     try:
-        resp = execute_query(query=query)
+        resp = await execute_query(query=query)
         return resp
     except Exception as e:
         msg = f"query execution failed: {e}"
@@ -1,59 +1,195 @@
-from typing import List
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 import logging
+from urllib.parse import quote
 
+import asyncio
+
+from cachetools import TTLCache
 from databricks.sdk.service.catalog import TableInfo, SchemaInfo, ColumnInfo, CatalogInfo, RegisteredModelInfo
-from databricks.sdk import WorkspaceClient
-from databricks.sdk.config import Config
 
-from .config import DatabricksSDKConfig
-from .lineage import get_table_lineage
-from .utils import format_table_info, format_schema_info
+from .clients import rest_client, fanout_slot
+from .config import CACHE_TTL_SECONDS
+from .lineage import get_table_lineages, evict_table_lineage
+from .utils import format_table_info, format_table_section, format_table_sections, format_schema_info, format_lineage_info
 
 logger = logging.getLogger(__name__)
 
-config: Config = DatabricksSDKConfig.authorize()
-sdk_client = WorkspaceClient(config=config)
+# table metadata keyed by full name; failed requests are never cached
+_table_cache: TTLCache = TTLCache(maxsize=4096, ttl=CACHE_TTL_SECONDS)
+
+# rendered Markdown sections keyed by (full_name, updated_at) -> (lineage, section)
+_section_cache: TTLCache = TTLCache(maxsize=2048, ttl=CACHE_TTL_SECONDS)
 
 
-def get_schemas_in_catalog(catalog_name: str) -> List[SchemaInfo]:
+async def _paginate(endpoint: str, key: str, params: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yields the `key` entries of a paginated Unity Catalog list endpoint, following `next_page_token`.
     """
-    Fetches all schema in a given catalog.
-    """    
-    schemas: List[SchemaInfo] = sdk_client.schemas.list(catalog_name=catalog_name)
-    schema_info = [schema for schema in schemas]
+    params = dict(params)
+    while True:
+        resp = await rest_client().do(method="GET", endpoint=endpoint, params=params)
+        for item in resp.get(key, []):
+            yield item
 
-    # Format the inforamation into markdown
-    output = format_schema_info(schema_info=schema_info)
-    return output
+        page_token = resp.get("next_page_token")
+        if not page_token:
+            return
+        params["page_token"] = page_token
 
 
-def get_tables_in_schema(catalog_name: str, schema_name: str) -> List[TableInfo]:
+async def _list_schemas(catalog_name: str, page_size: int = 500) -> AsyncIterator[SchemaInfo]:
     """
-    Fetches all tables in a given catalog and schema.
-    """    
-    tables: List[TableInfo] = sdk_client.tables.list(catalog_name=catalog_name, schema_name=schema_name)
-    table_info = [table for table in tables]
-    
+    Lists the schemas of a catalog through the Unity Catalog REST API.
+    """
+    params = {"catalog_name": catalog_name, "max_results": page_size}
+    async for schema in _paginate("/api/2.1/unity-catalog/schemas", "schemas", params):
+        yield SchemaInfo.from_dict(schema)
+
+
+async def _list_tables(catalog_name: str, schema_name: str, page_size: int = 500) -> AsyncIterator[TableInfo]:
+    """
+    Lists table summaries of a schema through the Unity Catalog REST API.
+
+    Columns and properties are omitted from the listing to keep pages small;
+    use `_get_table` for a table's full metadata.
+    """
+    params = {
+        "catalog_name": catalog_name,
+        "schema_name": schema_name,
+        "max_results": page_size,
+        "omit_columns": True,
+        "omit_properties": True,
+    }
+    async for table in _paginate("/api/2.1/unity-catalog/tables", "tables", params):
+        yield TableInfo.from_dict(table)
+
+
+async def _get_table(table_name: str) -> TableInfo:
+    """
+    Fetches table metadata through the Unity Catalog REST API, serving repeated lookups from the TTL cache.
+    """
+    try:
+        return _table_cache[table_name]
+    except KeyError:
+        pass
+
+    async with fanout_slot():
+        resp = await rest_client().do(method="GET", endpoint=f"/api/2.1/unity-catalog/tables/{quote(table_name, safe='.')}")
+    tableInfo = TableInfo.from_dict(resp)
+    _table_cache[table_name] = tableInfo
+    return tableInfo
+
+
+async def get_schemas_in_catalog(catalog_name: str, limit: int = 1000) -> str:
+    """
+    Fetches the schemas in a given catalog, stopping after `limit` schemas.
+    """
+    schemas = []
+    truncated = False
+    async for schema in _list_schemas(catalog_name, page_size=min(limit, 500)):
+        # only report truncation once a schema past the limit is actually seen
+        if len(schemas) >= limit:
+            truncated = True
+            break
+        schemas.append(schema)
+
     # Format the inforamation into markdown
-    output = format_table_info(table_info=table_info, lineage_info=[], extended=False)
+    output = format_schema_info(schema_info=schemas)
+    if truncated:
+        output += f"\n*Listing stopped at the limit of {limit} schemas; the catalog may contain more.*\n"
     return output
 
 
-def get_table_info(table_names: List) -> str:
+async def get_tables_in_schema(catalog_name: str, schema_name: str, limit: int = 1000) -> str:
     """
-    Fetches table metadata and lineage, then formats it into a Markdown string.
+    Fetches the tables in a given catalog and schema, stopping after `limit` tables.
     """
     table_info = []
-    lineage_info = []
-    
-    for table_name in table_names:
-        tableInfo: TableInfo = sdk_client.tables.get(full_name=table_name)
-        lineageInfo = get_table_lineage(table_name)
-        table_info.append(tableInfo)
-        lineage_info.append(lineageInfo)
+    truncated = False
+    async for table in _list_tables(catalog_name, schema_name, page_size=min(limit, 500)):
+        # only report truncation once a table past the limit is actually seen
+        if len(table_info) >= limit:
+            truncated = True
+            break
+        table_info.append(table)
     
     # Format the inforamation into markdown
-    output = format_table_info(table_info=table_info, lineage_info=lineage_info, extended=True)
+    output = format_table_info(table_info=table_info)
+    if truncated:
+        output += f"\n*Listing stopped at the limit of {limit} tables; the schema may contain more.*\n"
+    return output
+
+
+def _format_table_section(tableInfo: TableInfo, lineageInfo: Optional[dict]) -> str:
+    """
+    Formats a table section, reusing the cached Markdown while the table is unchanged.
+    """
+    key = (tableInfo.full_name, tableInfo.updated_at, lineageInfo is not None)
+    cached = _section_cache.get(key)
+    # lineage objects come from the lineage TTL cache, so identity means unchanged
+    if cached and cached[0] is lineageInfo:
+        return cached[1]
+
+    section = format_table_section(tableInfo, lineageInfo)
+    _section_cache[key] = (lineageInfo, section)
+    return section
+
+
+async def get_table_info(
+    table_names: List,
+    refresh: bool = False,
+    include_lineage: bool = False,
+    on_progress: Optional[Callable[[int, int], Awaitable[None]]] = None,
+) -> str:
+    """
+    Fetches table metadata (and lineage when `include_lineage` is set), then formats it into a Markdown string.
+
+    All requests are issued concurrently and each table is rendered as soon as
+    its own metadata (and the lineage batch) has arrived, so Markdown assembly
+    overlaps the remaining network calls. `on_progress(done, total)` is awaited
+    after each table section is rendered. Set `refresh` to bypass the caches
+    for these tables.
+    """
+    if refresh:
+        for table_name in table_names:
+            _table_cache.pop(table_name, None)
+        evict_table_lineage(table_names)
+
+    lineage_task = asyncio.ensure_future(get_table_lineages(table_names)) if include_lineage else None
+
+    done = 0
+
+    async def _fetch_and_format(idx: int, table_name: str) -> str:
+        nonlocal done
+        tableInfo = await _get_table(table_name)
+        lineageInfo = (await lineage_task)[idx] if lineage_task else None
+        section = _format_table_section(tableInfo, lineageInfo)
+        done += 1
+        if on_progress:
+            await on_progress(done, len(table_names))
+        return section
+
+    try:
+        # gather preserves the input ordering of `table_names`
+        sections = await asyncio.gather(
+            *[_fetch_and_format(idx, table_name) for idx, table_name in enumerate(table_names)]
+        )
+    finally:
+        if lineage_task and not lineage_task.done():
+            lineage_task.cancel()
+
+    output = format_table_sections(sections)
     return output
 
 
+async def get_table_lineage_info(table_names: List, refresh: bool = False) -> str:
+    """
+    Fetches upstream/downstream lineage for the given tables and formats it into a Markdown string.
+    """
+    if refresh:
+        evict_table_lineage(table_names)
+
+    lineage_info = await get_table_lineages(table_names)
+
+    output = format_lineage_info(table_names=table_names, lineage_info=lineage_info)
+    return output
@@ -1,37 +1,33 @@
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
+import io
 import logging
+from operator import attrgetter
 
-from databricks.sdk.service.catalog import TableInfo, TableConstraint, SchemaInfo, ColumnInfo, CatalogInfo, RegisteredModelInfo
+from databricks.sdk.service.catalog import TableInfo, TableConstraint, PrimaryKeyConstraint, ForeignKeyConstraint, NamedTableConstraint, SchemaInfo, ColumnInfo, CatalogInfo, RegisteredModelInfo
+
+from . import _json
+from .config import MAX_LINEAGE_NODES
 
 logger = logging.getLogger(__name__)
 
-def _format_column_info(column: ColumnInfo) -> str:
-    """Format a single column into a compact row.
-    
-    Args:
-        column: ColumnInfo object to format
-        
-    Returns:
-        Formatted column row as string
-    """
-    name = column.name
-    type_text = column.type_text
-    nullable = "TRUE" if column.nullable else "FALSE"
-    comment = column.comment or ""
-    return f"| {name} | {type_text} | {nullable} | {comment} |"
+# Column field getter, built once rather than per column
+_column_fields = attrgetter("name", "type_text", "nullable", "comment")
 
+# Rendering of a constraint's RELY option
+_RELY = {True: "TRUE", False: "FALSE", None: "UNKNOWN"}
 
-def _format_columns(columns: Optional[List[ColumnInfo]]) -> str:
-    """Format table columns into a markdown table.
+
+def _column_rows(columns: Optional[List[ColumnInfo]]) -> List[str]:
+    """Format table columns into the rows of a markdown table.
     
     Args:
         columns: List of ColumnInfo objects
         
     Returns:
-        Formatted markdown table with columns
+        Markdown table rows (header included)
     """
     if not columns:
-        return "No columns defined."
+        return ["No columns defined."]
     
     # Header
     rows = [
@@ -40,10 +36,27 @@ def _format_columns(columns: Optional[List[ColumnInfo]]) -> str:
     ]
     
     # Add each column
-    for col in columns:
-        rows.append(_format_column_info(col))
+    rows += [
+        f"| {name} | {type_text} | {'TRUE' if nullable else 'FALSE'} | {comment or ''} |"
+        for name, type_text, nullable, comment in map(_column_fields, columns)
+    ]
+    return rows
+
+
+def _extract_names(entries: Iterable[Dict]) -> List[str]:
+    """Extract `catalog.schema.table` names from lineage entries.
     
-    return "\n".join(rows)
+    Entries without a tableInfo, or whose tableInfo lacks any of the three
+    name parts (e.g. notebooks or jobs), are skipped.
+    """
+    return [
+        f"{catalog}.{schema}.{table}"
+        for entry in entries
+        if (table_info := entry.get("tableInfo"))
+        and (catalog := table_info.get("catalog_name"))
+        and (schema := table_info.get("schema_name"))
+        and (table := table_info.get("name"))
+    ]
 
 
 def _format_lineage_info(lineage: Dict) -> str:
@@ -52,6 +65,9 @@ def _format_lineage_info(lineage: Dict) -> str:
     Parses the tableInfo from upstreams and downstreams and formats them
     as full_table_name (catalog.schema.table).
     
+    At most `MAX_LINEAGE_NODES` tables are listed per direction; the rest
+    are summarised as a count.
+    
     Args:
         lineage: Lineage dictionary with 'upstreams' and/or 'downstreams' keys,
                  each containing tableInfo objects
@@ -63,59 +79,54 @@ def _format_lineage_info(lineage: Dict) -> str:
         return "No lineage information"
     
     sections = []
+    for label, key in (("Upstream", "upstreams"), ("Downstream", "downstreams")):
+        table_names = _extract_names(lineage.get(key) or ())
+        if table_names:
+            shown = ", ".join(f"`{t}`" for t in table_names[:MAX_LINEAGE_NODES])
+            if len(table_names) > MAX_LINEAGE_NODES:
+                shown += f", …(+{len(table_names) - MAX_LINEAGE_NODES} more)"
+            sections.append(f"**{label} Tables:** {shown}")
     
-    def _extract_table_name(table_info: Optional[Dict]) -> Optional[str]:
-        """Extract and format table name as catalog.schema.table."""
-        if not table_info:
-            return None
-        catalog = table_info.get("catalog_name", "")
-        schema = table_info.get("schema_name", "")
-        table = table_info.get("name", "")
-        
-        if all([catalog, schema, table]):
-            return f"{catalog}.{schema}.{table}"
-        return None
-    
-    # Format upstreams - extract tableInfo from each upstream entry
-    upstreams = lineage.get("upstreams", [])
-    if upstreams:
-        upstream_tables = []
-        for upstream in upstreams:
-            table_info = upstream.get("tableInfo")
-            table_name = _extract_table_name(table_info)
-            if table_name:
-                upstream_tables.append(table_name)
-        
-        if upstream_tables:
-            sections.append(f"**Upstream Tables:** {', '.join(f'`{t}`' for t in upstream_tables)}")
-    
-    # Format downstreams - extract tableInfo from each downstream entry
-    downstreams = lineage.get("downstreams", [])
-    if downstreams:
-        downstream_tables = []
-        for downstream in downstreams:
-            table_info = downstream.get("tableInfo")
-            table_name = _extract_table_name(table_info)
-            if table_name:
-                downstream_tables.append(table_name)
-        
-        if downstream_tables:
-            sections.append(f"**Downstream Tables:** {', '.join(f'`{t}`' for t in downstream_tables)}")
-    
-    return "\n".join(sections) if sections else ""
+    return "\n".join(sections)
+
+
+def _fmt_pk(pk: PrimaryKeyConstraint) -> str:
+    """Format a primary key constraint as a constraint table row."""
+    timeseries = pk.timeseries_columns
+    details = f"timeseries_columns={', '.join(timeseries)}" if timeseries else "N/A"
+    return f"| {pk.name} | PRIMARY_KEY | {', '.join(pk.child_columns)} | {details} | {_RELY.get(pk.rely, 'UNKNOWN')} |"
 
 
-def _format_table_constraints(constraints: List[TableConstraint]) -> str:
-    """Format table constraints into a markdown section.
+def _fmt_fk(fk: ForeignKeyConstraint) -> str:
+    """Format a foreign key constraint as a constraint table row."""
+    parent_str = f"references {fk.parent_table}({', '.join(fk.parent_columns)})"
+    return f"| {fk.name} | FOREIGN_KEY | {', '.join(fk.child_columns)} | {parent_str} | {_RELY.get(fk.rely, 'UNKNOWN')} |"
+
+
+def _fmt_named(nt: NamedTableConstraint) -> str:
+    """Format a named table constraint as a constraint table row."""
+    return f"| {nt.name} | NAMED_CONSTRAINT | N/A | N/A | N/A |"
+
+
+# TableConstraint attribute -> row formatter, checked in order
+_CONSTRAINT_HANDLERS = (
+    ("primary_key_constraint", _fmt_pk),
+    ("foreign_key_constraint", _fmt_fk),
+    ("named_table_constraint", _fmt_named),
+)
+
+
+def _constraint_rows(constraints: List[TableConstraint]) -> List[str]:
+    """Format table constraints into the rows of a markdown table.
     
     Args:
         constraints: List of TableConstraint objects
         
     Returns:
-        Formatted markdown table with constraints or empty string if none exist
+        Markdown table rows (header included)
     """
     if not constraints:
-        return "No constraints"
+        return ["No constraints"]
 
     rows = [
         "| Constraint Name | Type | Columns | Details | Rely |",
@@ -123,48 +134,23 @@ def _format_table_constraints(constraints: List[TableConstraint]) -> str:
     ]
 
     for constraint in constraints:
-        # Determine which concrete constraint is present
-        if constraint.primary_key_constraint:
-            pk = constraint.primary_key_constraint
-            name = pk.name
-            child_cols = pk.child_columns
-            cols_str = ", ".join(child_cols) if len(child_cols) > 1 else child_cols[0]
-            timeseries = pk.timeseries_columns
-            details = f"timeseries_columns={', '.join(timeseries)}" if timeseries else "N/A"
-            rely = pk.rely
-            rely_str = "TRUE" if rely is True else ("FALSE" if rely is False else "UNKNOWN")
-            rows.append(f"| {name} | PRIMARY_KEY | {cols_str} | {details} | {rely_str} |")
-            continue
-
-        if constraint.foreign_key_constraint:
-            fk = constraint.foreign_key_constraint
-            name = fk.name
-            child_cols = fk.child_columns
-            cols_str = ", ".join(child_cols) if len(child_cols) > 1 else child_cols[0]
-            parent_table = fk.parent_table
-            parent_cols = fk.parent_columns
-            parent_str = f"references {parent_table}({', '.join(parent_cols)})"
-            rely = fk.rely
-            rely_str = "TRUE" if rely is True else ("FALSE" if rely is False else "UNKNOWN")
-            rows.append(f"| {name} | FOREIGN_KEY | {cols_str} | {parent_str} | {rely_str} |")
-            continue
-
-        if constraint.named_table_constraint:
-            nt = constraint.named_table_constraint
-            name = nt.name
-            rows.append(f"| {name} | NAMED_CONSTRAINT | N/A | N/A | N/A |")
-            continue
-
-    return "\n".join(rows)
-
-
-def _format_single_table(table: TableInfo, lineage: Dict) -> str:
+        # Render whichever concrete constraint is present
+        for attr, fmt in _CONSTRAINT_HANDLERS:
+            value = getattr(constraint, attr)
+            if value:
+                rows.append(fmt(value))
+                break
+
+    return rows
+
+
+def _format_single_table(table: TableInfo, lineage: Optional[Dict]) -> str:
     """Format a single table's information into markdown.
     
     Args:
         table: TableInfo object containing table metadata
-        lineage: Optional lineage information dictionary
-        extended: Whether to include extended information
+        lineage: Optional lineage information dictionary; the lineage section
+            is omitted entirely when None (lineage was not requested)
         
     Returns:
         Formatted markdown string for the table
@@ -175,7 +161,7 @@ def _format_single_table(table: TableInfo, lineage: Dict) -> str:
     data_source = table.data_source_format or "UNKNOWN"
     comment = table.comment or "No description"
     
-    # Build the table section
+    # Build the table section as one list of lines, joined once
     lines = [
         f"## Table",
         f"**Name:** `{full_name}`",
@@ -188,18 +174,16 @@ def _format_single_table(table: TableInfo, lineage: Dict) -> str:
     # Add schema/columns section
     if table.columns:
         lines.append("### Schema")
-        lines.append(_format_columns(table.columns))
+        lines.extend(_column_rows(table.columns))
         lines.append("")
         
-    # Add table constraints section if available
-    constraints_section = _format_table_constraints(table.table_constraints)
-    if constraints_section:
-        lines.append("### Constraints")
-        lines.append(constraints_section)
-        lines.append("")
+    # Add table constraints section
+    lines.append("### Constraints")
+    lines.extend(_constraint_rows(table.table_constraints))
+    lines.append("")
     
-    # Add lineage section if available
-    lineage_section = _format_lineage_info(lineage)
+    # Add lineage section if requested and available
+    lineage_section = _format_lineage_info(lineage) if lineage is not None else ""
     if lineage_section:
         lines.append("### Lineage")
         lines.append(lineage_section)
@@ -208,105 +192,136 @@ def _format_single_table(table: TableInfo, lineage: Dict) -> str:
     return "\n".join(lines)
 
 
-def format_table_info(table_info: List[TableInfo], lineage_info: Optional[List[Dict]] = [], extended: Optional[bool] = False) -> str:
-    """Parse and format multiple table information into LLM-friendly Markdown.
+def format_table_section(table: TableInfo, lineage: Optional[Dict]) -> str:
+    """Format a single table's section of the extended table document.
     
-    This function takes table metadata and lineage information and formats it
-    into a structured markdown document optimized for consumption by LLMs.
+    Falls back to the raw table metadata and lineage if the table cannot be
+    parsed, so one malformed table does not fail the whole document.
     
     Args:
-        table_info: table metadata objects
-        lineage_info: lineage data for each table
-        extended: Whether to include extended information
-            
+        table: TableInfo object containing table metadata
+        lineage: lineage data for the table, or None to omit the lineage section
+        
+    Returns:
+        Formatted markdown section for the table
+    """
+    logger.info(f"parsing table `{table.full_name}` info")
+    
+    try:
+        return _format_single_table(table, lineage) + "\n"
+    except Exception as e:
+        msg = f"Error parsing table info `{table.full_name}`: {e}"
+        logger.error(msg)
+        logger.warning("Falling back to entire table info and lineage information")
+        return (
+            f"{msg}\n\n"
+            f"Table Info:\n```json\n{_json.dumps(table.as_dict())}\n```\n\n"
+            f"Lineage Info:\n```json\n{_json.dumps(lineage)}\n```\n\n"
+        )
+
+
+def format_table_sections(sections: List[str]) -> str:
+    """Join per-table sections (see `format_table_section`) into the extended table document.
+    
+    Args:
+        sections: formatted table sections, in output order
+        
     Returns:
         Formatted markdown string with all table information
     """
-    if not table_info:
+    if not sections:
         return "**No tables found**"
 
-    if lineage_info:
-        print(lineage_info)
-        assert len(table_info) == len(lineage_info), ValueError("table info and lineage info length mismatch")
-    else:
-        lineage_info.extend({} for _ in table_info)
+    buf = io.StringIO()
+    buf.write("# Table Information\n\n")
+    for idx, section in enumerate(sections, 1):
+        buf.write(section)
+        # Add separator between tables (except after the last one)
+        if idx < len(sections):
+            buf.write("---\n\n")
+
+    return buf.getvalue()
+
+
+def format_lineage_info(table_names: List[str], lineage_info: List[Dict]) -> str:
+    """Format the lineage of multiple tables into LLM-friendly Markdown.
     
-    # Build the document
-    if extended:
-        doc_lines = [
-            "# Table Information",
-            "",
-        ]
-        
-        # Format each table
-        for idx, (table, lineage) in enumerate(zip(table_info, lineage_info), 1):
-            table: TableInfo
-            logger.info(f"parsing table `{table.full_name}` info")
+    Args:
+        table_names: fully qualified table names
+        lineage_info: lineage data for each table, in the same order
             
-            try:
-                formatted_table = _format_single_table(table, lineage)
-                doc_lines.append(formatted_table)
-            except Exception as e:
-                msg = f"Error parsing table info `{table.full_name}`: {e}"
-                logger.error(msg)
-                logger.warning("Falling back to entire table info and lineage information")
-                doc_lines.append(msg)
-                doc_lines.append("")
-                doc_lines.append("Table Info:")
-                doc_lines.append(f"{table.as_dict()}")
-                doc_lines.append("")
-                doc_lines.append("Lineage Info:")
-                doc_lines.append(f"{lineage_info}")
-                doc_lines.append("")
-
-            # Add separator between tables (except after the last one)
-            if idx < len(table_info):
-                doc_lines.append("---")
-                doc_lines.append("")
-    else:
-        doc_lines = [
-            f"# List of tables in `{table_info[0].catalog_name}.{table_info[0].schema_name}`",
-            "",
-            f"*Number of tables*: {len(table_info)}",
-            "",
-            "## Table names:",
-            "",
-        ]
-
-        table_names = [table.name for table in table_info]
-        doc_lines.append(", ".join(table_names))
-        doc_lines.append("")
+    Returns:
+        Formatted markdown string with upstream/downstream tables per table
+    """
+    if not table_names:
+        return "**No tables found**"
 
-    return "\n".join(doc_lines)
+    buf = io.StringIO()
+    buf.write("# Table Lineage\n\n")
+    for table_name, lineage in zip(table_names, lineage_info):
+        buf.write(f"## `{table_name}`\n")
+        buf.write(_format_lineage_info(lineage) or "No upstream or downstream tables")
+        buf.write("\n\n")
+
+    return buf.getvalue()
 
 
-def format_schema_info(schema_info: List[SchemaInfo]) -> str:
+def format_table_info(table_info: List[TableInfo]) -> str:
+    """Format the tables of a schema into an LLM-friendly Markdown listing.
+    
+    Only the table names are listed; see `format_table_section` and
+    `format_table_sections` for the detailed per-table document.
+    
+    Args:
+        table_info: table metadata objects
+            
+    Returns:
+        Formatted markdown string listing the table names
+    """
+    if not table_info:
+        return "**No tables found**"
+
+    buf = io.StringIO()
+    buf.write(f"# List of tables in `{table_info[0].catalog_name}.{table_info[0].schema_name}`\n\n")
+    buf.write(f"*Number of tables*: {len(table_info)}\n\n")
+    buf.write("## Table names:\n\n")
+    buf.write(", ".join(table.name for table in table_info))
+    buf.write("\n")
+
+    return buf.getvalue()
+
+
+def format_schema_info(schema_info: Iterable[SchemaInfo]) -> str:
     """Format schema information into markdown.
     
+    The schemas are consumed in a single pass, so a lazily paginated
+    iterator can be passed in without materializing it first.
+    
     Args:
-        schema_info: SchemaInfo object containing schema metadata
+        schema_info: SchemaInfo objects containing schema metadata
         
     Returns:
         Formatted markdown string for the schema
     """
-    if not schema_info:
-        return "**No schemas found**"
-    
-    doc_lines = [
-        f"# List of schemas in `{schema_info[0].catalog_name}`",
-        "",
-        f"*Number of schemas*: {len(schema_info)}",
-        "",
-    ]
+    catalog_name = None
+    num_schemas = 0
+    schema_lines = []
+
+    for schema in schema_info:
+        if num_schemas:
+            schema_lines.append("---")
+            schema_lines.append("")
+        else:
+            catalog_name = schema.catalog_name
+        num_schemas += 1
 
-    for idx, schema in enumerate(schema_info, 1):
         logger.info(f"parsing schema `{schema.full_name}` info")
 
         name = schema.name
         comment = schema.comment or "No description"
         
         try:
-            doc_lines += [
+            schema_lines += [
                 f"## Schema",
                 f"**Name:** `{name}`",
                 f"**Description:** {comment}",
@@ -316,14 +331,21 @@ def format_schema_info(schema_info: List[SchemaInfo]) -> str:
             msg = f"Error parsing schema info `{schema.full_name}`: {e}"
             logger.error(msg)
             logger.warning("Falling back to entire schema information")
-            doc_lines.append(msg)
-            doc_lines.append("")
-            doc_lines.append("Schema Info:")
-            doc_lines.append(f"{schema.as_dict()}")
-            doc_lines.append("")
-
-        if idx < len(schema_info):
-            doc_lines.append("---")
-            doc_lines.append("")
+            schema_lines.append(msg)
+            schema_lines.append("")
+            schema_lines.append("Schema Info:")
+            schema_lines.append(f"```json\n{_json.dumps(schema.as_dict())}\n```")
+            schema_lines.append("")
+
+    if not num_schemas:
+        return "**No schemas found**"
+    
+    doc_lines = [
+        f"# List of schemas in `{catalog_name}`",
+        "",
+        f"*Number of schemas*: {num_schemas}",
+        "",
+    ]
+    doc_lines += schema_lines
     
     return "\n".join(doc_lines)
@@ -1,48 +1,104 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import logging
 import os
 
-from databricks.sdk.service.sql import StatementResponse, StatementState, ResultManifest, ResultData, Format
-from databricks.sdk import WorkspaceClient
-from databricks.sdk.config import Config
+import asyncio
 
-from .config import DatabricksSDKConfig
+from databricks.sdk.service.sql import ExecuteStatementRequestOnWaitTimeout, StatementResponse, StatementState, StatementParameterListItem, ResultManifest, ResultData, Format
+
+from .clients import sdk_client, run_blocking
 
 logger = logging.getLogger(__name__)
 
 DATABRICKS_SQL_WAREHOUSE_ID = os.getenv("DATABRICKS_SQL_WAREHOUSE_ID")
 
-config: Config = DatabricksSDKConfig.authorize()
-sdk_client = WorkspaceClient(config=config)
+_TERMINAL_STATES = frozenset({
+    StatementState.SUCCEEDED,
+    StatementState.FAILED,
+    StatementState.CANCELED,
+    StatementState.CLOSED,
+})
+
+
+async def _fetch_chunks(resp: StatementResponse) -> List[List[List[str]]]:
+    """
+    Returns the row chunks of a succeeded statement, in order.
+
+    The response only inlines the first chunk of a large result; the remaining
+    chunks are fetched concurrently.
+    """
+    total_chunks = resp.manifest.total_chunk_count or 1
+    first: ResultData = resp.result
+    if total_chunks <= 1:
+        return [first.data_array]
+
+    logger.info(f"{resp.statement_id} - fetching {total_chunks - 1} more result chunks")
+    statement_execution = sdk_client().statement_execution
+    rest = await asyncio.gather(*[
+        run_blocking(statement_execution.get_statement_result_chunk_n, resp.statement_id, idx)
+        for idx in range((first.chunk_index or 0) + 1, total_chunks)
+    ])
+    return [first.data_array, *(chunk.data_array or [] for chunk in rest)]
 
 
-def execute_query(query: str) -> Dict[str, Any]:
+async def execute_query(
+    query: str,
+    parameters: Optional[List[StatementParameterListItem]] = None,
+    wait_timeout: str = "50s",
+    on_wait_timeout: Optional[ExecuteStatementRequestOnWaitTimeout] = None,
+) -> Dict[str, Any]:
     """
     Execute sql query using Databricks SQL Warehouse. 
+
+    The statement is submitted with a `wait_timeout` server-side wait (50s by
+    default); if it is still pending or running after that, it is polled with
+    exponential backoff (0.25s doubling up to 4s) without blocking the event
+    loop. Pass `on_wait_timeout=CANCEL` to have the server cancel it instead,
+    bounding the call to `wait_timeout`. Named `parameters` are bound to
+    `:name` markers in the query.
     """
-    resp: StatementResponse = sdk_client.statement_execution.execute_statement(
+    statement_execution = sdk_client().statement_execution
+    resp: StatementResponse = await run_blocking(
+        statement_execution.execute_statement,
         statement=query,
+        parameters=parameters,
         warehouse_id=DATABRICKS_SQL_WAREHOUSE_ID,
-        wait_timeout="50s",
+        wait_timeout=wait_timeout,
+        on_wait_timeout=on_wait_timeout,
         format=Format.JSON_ARRAY,
         # row_limit=100,
     )
     logger.info(f"{resp.statement_id} - initiated statement execution")
 
-    while True:
-        if resp.status:
-            if resp.status.state == StatementState.SUCCEEDED:
-                logger.info(f"{resp.statement_id} - statement successfully executed")
-                if resp.result.data_array:
-                    data: ResultData = resp.result.data_array
-                    manifest: ResultManifest = resp.manifest
-                    column_names = [col.name for col in manifest.schema.columns]
-                    results = [dict(zip(column_names, row)) for row in data]
-                    return {"query": query, "state": f"{resp.status.state.value}", "data": results}
-                else:
-                    return {"query": query, "state": f"{resp.status.state.value}", "data": []}
-            elif resp.status.error:
-                msg = f"{resp.status.error.error_code} - {resp.status.error.message}"
-                logger.error(f"{resp.statement_id} - statement failed: \n{msg}")
-                return {"query": query, "state": f"{resp.status.state.value}", "error": msg}
+    attempt = 0
+    while resp.status and resp.status.state not in _TERMINAL_STATES:
+        await asyncio.sleep(min(0.25 * 2 ** attempt, 4))
+        attempt += 1
+        resp = await run_blocking(statement_execution.get_statement, resp.statement_id)
+
+    if not resp.status:
+        msg = "statement response did not include a status"
+        logger.error(f"{resp.statement_id} - statement failed: \n{msg}")
+        return {"query": query, "state": "UNKNOWN", "error": msg}
+
+    state = resp.status.state
+    if state == StatementState.SUCCEEDED:
+        logger.info(f"{resp.statement_id} - statement successfully executed")
+        if resp.result and resp.result.data_array:
+            manifest: ResultManifest = resp.manifest
+            column_names = tuple(col.name for col in manifest.schema.columns)
+            results = [
+                dict(zip(column_names, row, strict=True))
+                for chunk in await _fetch_chunks(resp)
+                for row in chunk
+            ]
+            return {"query": query, "state": f"{state.value}", "data": results}
+        else:
+            return {"query": query, "state": f"{state.value}", "data": []}
 
+    if resp.status.error:
+        msg = f"{resp.status.error.error_code} - {resp.status.error.message}"
+    else:
+        msg = f"statement ended in state {state.value}"
+    logger.error(f"{resp.statement_id} - statement failed: \n{msg}")
+    return {"query": query, "state": f"{state.value}", "error": msg}
@@ -1,11 +1,15 @@
 import os
+import threading
 
 from mcp.server.fastmcp import FastMCP
 
+from databricks_mcp_server.clients import warmup
+
 from databricks_mcp_server.tools import (
     fetch_schemas_in_catalog,
     fetch_tables_in_schema,
     fetch_table_info,
+    fetch_table_lineage,
     execute_spark_sql_query,
 )
 
@@ -22,8 +26,13 @@ mcp = FastMCP(
 mcp.add_tool(fetch_schemas_in_catalog)
 mcp.add_tool(fetch_tables_in_schema)
 mcp.add_tool(fetch_table_info)
+mcp.add_tool(fetch_table_lineage)
 mcp.add_tool(execute_spark_sql_query)
 
+# Authorize and open pooled connections in the background so the first tool
+# call does not pay the TLS handshake and token exchange.
+threading.Thread(target=warmup, name="dbx-warmup", daemon=True).start()
+
 # To deploy using uvicorn `uvicorn server:app --host 0.0.0.0 --port 8000`
 # app = mcp.streamable_http_app()
 